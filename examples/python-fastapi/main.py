@@ -6,6 +6,10 @@ and access protected endpoints programmatically.
 
 Run with:
     uvicorn main:app --reload --port 3000
+
+For production, install the uvicorn extras and use the C event loop and
+HTTP parser (typically 2-3x throughput for short JSON endpoints):
+    uvicorn main:app --loop uvloop --http httptools --workers 4 --port 3000
 """
 
 from fastapi import Depends, FastAPI
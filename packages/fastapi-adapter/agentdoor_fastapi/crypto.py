@@ -5,12 +5,33 @@ Provides server-side signature verification using PyNaCl.
 
 from __future__ import annotations
 
-import base64
+from functools import lru_cache
+from typing import Iterable
+
+try:
+    # SIMD-accelerated drop-in for the stdlib base64 codec.  Optional:
+    # the stdlib fallback keeps the dependency set unchanged.
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
 
-from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
 
+@lru_cache(maxsize=1024)
+def _get_verify_key(public_key_b64: str) -> VerifyKey | None:
+    """Decode and cache a ``VerifyKey`` for a base64-encoded public key.
+
+    Agents verify repeatedly with the same key, so the base64 decode and
+    key-object construction are paid once per key rather than per call.
+    Returns ``None`` for keys that are not valid base64/Ed25519 material.
+    """
+    try:
+        return VerifyKey(b64decode(public_key_b64))
+    except Exception:
+        return None
+
+
 def verify_signature(message: str, signature_b64: str, public_key_b64: str) -> bool:
     """Verify an Ed25519 signature against a message and public key.
 
@@ -22,16 +43,35 @@ def verify_signature(message: str, signature_b64: str, public_key_b64: str) -> b
     Returns:
         ``True`` if the signature is valid, ``False`` otherwise.
     """
+    verify_key = _get_verify_key(public_key_b64)
+    if verify_key is None:
+        return False
     try:
-        public_key_bytes = base64.b64decode(public_key_b64)
-        signature_bytes = base64.b64decode(signature_b64)
-        verify_key = VerifyKey(public_key_bytes)
+        signature_bytes = b64decode(signature_b64)
         verify_key.verify(message.encode("utf-8"), signature_bytes)
         return True
-    except (BadSignatureError, Exception):
+    except Exception:
         return False
 
 
+def verify_signatures_batch(
+    items: Iterable[tuple[str, str, str]],
+) -> list[bool]:
+    """Verify a batch of ``(message, signature_b64, public_key_b64)`` tuples.
+
+    Useful for auth storms (e.g. many agents re-authenticating after a
+    restart).  PyNaCl does not expose libsodium's batched open call, so
+    this amortizes the per-key setup via the shared key cache instead.
+
+    Returns:
+        A list of booleans, one per input tuple, in order.
+    """
+    return [
+        verify_signature(message, signature_b64, public_key_b64)
+        for message, signature_b64, public_key_b64 in items
+    ]
+
+
 def is_timestamp_valid(timestamp: str, max_drift_seconds: int = 300) -> bool:
     """Check whether a signed timestamp is within acceptable drift.
 
@@ -7,12 +7,18 @@ dependency for protecting individual routes.
 
 from __future__ import annotations
 
-import secrets
+import asyncio
+import hmac
+import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
 
 from .crypto import is_timestamp_valid, verify_signature
@@ -27,7 +33,50 @@ from .models import (
     VerifyRequest,
     VerifyResponse,
 )
-from .store import AgentStore, InMemoryAgentStore, TokenRecord
+from .store import AgentStore, InMemoryAgentStore, TokenRecord, _token_urlsafe
+
+# Ed25519 verification is CPU-bound (~50-100us per call); running it on
+# a small thread pool keeps the event loop responsive during auth storms.
+_VERIFY_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="agentdoor-verify",
+)
+
+
+async def _verify_signature_async(
+    message: str, signature_b64: str, public_key_b64: str
+) -> bool:
+    """Run :func:`verify_signature` off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _VERIFY_POOL, verify_signature, message, signature_b64, public_key_b64
+    )
+
+
+# Pre-constructed exceptions for the static error paths.  Building an
+# HTTPException per failed request is pure allocation overhead, and under
+# scanner/attack traffic the error paths dominate.  Dynamically-formatted
+# errors (e.g. invalid scope lists) are still raised inline.
+_ERR_REGISTRATION_NOT_FOUND = HTTPException(
+    status_code=404, detail="Registration not found or expired"
+)
+_ERR_CHALLENGE_MISMATCH = HTTPException(
+    status_code=400, detail="Challenge mismatch"
+)
+_ERR_INVALID_SIGNATURE = HTTPException(
+    status_code=401, detail="Invalid signature"
+)
+_ERR_UNKNOWN_AGENT = HTTPException(status_code=401, detail="Unknown agent")
+_ERR_INVALID_API_KEY = HTTPException(status_code=401, detail="Invalid API key")
+_ERR_STALE_TIMESTAMP = HTTPException(
+    status_code=401, detail="Timestamp outside acceptable range"
+)
+_ERR_MISSING_AUTH = HTTPException(
+    status_code=401, detail="Missing or invalid Authorization header"
+)
+_ERR_INVALID_TOKEN = HTTPException(
+    status_code=401, detail="Invalid or expired token"
+)
 
 
 @dataclass
@@ -43,6 +92,12 @@ class AgentDoorConfig:
         store: The agent store backend.  Defaults to an in-memory store.
         route_prefix: URL prefix for AgentDoor endpoints (without
             trailing slash).
+        enable_compression: Whether to add gzip compression middleware
+            to the application.  JSON responses compress well, and for
+            responses above the minimum size the wire cost usually
+            dominates the CPU cost of compressing.  Off by default
+            because the middleware applies to the whole host app; leave
+            it off if the app already compresses its responses.
     """
 
     service_name: str = "AgentDoor Service"
@@ -51,6 +106,17 @@ class AgentDoorConfig:
     max_timestamp_drift: int = 300
     store: AgentStore | None = None
     route_prefix: str = "/agentdoor"
+    enable_compression: bool = False
+
+    def __post_init__(self) -> None:
+        # Intern the strings that get hashed and compared on every
+        # request (scope names in particular), so set/dict operations
+        # can short-circuit on pointer identity.
+        self.route_prefix = sys.intern(self.route_prefix)
+        self.scopes = [
+            {k: sys.intern(v) for k, v in scope.items()}
+            for scope in self.scopes
+        ]
 
 
 class AgentDoor:
@@ -85,6 +151,21 @@ class AgentDoor:
             ],
             token_ttl_seconds=self._config.token_ttl_seconds,
         )
+        # The discovery document is immutable after construction, so
+        # serialize it once and serve the cached bytes on every request.
+        self._discovery_bytes = self._discovery_doc.model_dump_json().encode()
+        # Scope names offered by this service, cached for validation in
+        # the registration handler.
+        self._available_scopes = frozenset(
+            s["name"] for s in self._config.scopes
+        )
+
+        if self._config.enable_compression:
+            # Small responses (auth/verify bodies) stay below the
+            # threshold and skip compression entirely.
+            self._app.add_middleware(
+                GZipMiddleware, minimum_size=512, compresslevel=5
+            )
 
         self._mount_routes()
 
@@ -145,9 +226,16 @@ class AgentDoor:
     # Endpoint handlers
     # ------------------------------------------------------------------
 
-    async def _handle_discovery(self) -> DiscoveryDocument:
-        """GET /.well-known/agentdoor.json"""
-        return self._discovery_doc
+    async def _handle_discovery(self) -> Response:
+        """GET /.well-known/agentdoor.json
+
+        Serves the pre-serialized discovery document, bypassing Pydantic
+        serialization on what is a purely static response.
+        """
+        return Response(
+            content=self._discovery_bytes,
+            media_type="application/json",
+        )
 
     async def _handle_register(
         self, body: RegistrationRequest
@@ -158,19 +246,22 @@ class AgentDoor:
         with a challenge that the agent must sign.
         """
         # Validate requested scopes
-        available = {s["name"] for s in self._config.scopes}
-        if available:
-            invalid = set(body.scopes) - available
+        if self._available_scopes and body.scopes:
+            invalid = [
+                s for s in body.scopes if s not in self._available_scopes
+            ]
             if invalid:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Invalid scopes: {', '.join(sorted(invalid))}",
+                    detail=f"Invalid scopes: {', '.join(sorted(set(invalid)))}",
                 )
 
         pending = await self._store.create_pending_registration(
             agent_name=body.agent_name,
             public_key=body.public_key,
-            scopes=body.scopes,
+            # Interning maps granted scopes onto the same canonical
+            # strings as the config, speeding later membership checks.
+            scopes=[sys.intern(s) for s in body.scopes],
         )
 
         return RegistrationResponse(
@@ -185,29 +276,30 @@ class AgentDoor:
         """
         pending = await self._store.get_pending_registration(body.registration_id)
         if pending is None:
-            raise HTTPException(
-                status_code=404,
-                detail="Registration not found or expired",
-            )
+            raise _ERR_REGISTRATION_NOT_FOUND
 
-        # Verify that the challenge matches
-        if body.challenge != pending.challenge:
-            raise HTTPException(
-                status_code=400,
-                detail="Challenge mismatch",
-            )
+        # Verify that the challenge matches (constant-time; compare
+        # bytes, since compare_digest rejects non-ASCII str and the
+        # client controls this value)
+        if not hmac.compare_digest(
+            body.challenge.encode("utf-8"), pending.challenge.encode("utf-8")
+        ):
+            raise _ERR_CHALLENGE_MISMATCH
 
         # Verify the signature
-        if not verify_signature(body.challenge, body.signature, pending.public_key):
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid signature",
-            )
+        if not await _verify_signature_async(
+            body.challenge, body.signature, pending.public_key
+        ):
+            raise _ERR_INVALID_SIGNATURE
 
-        # Promote to full agent
+        # Promote to full agent; the registration may have been claimed
+        # by a concurrent verify (or swept) while the signature check
+        # was awaited.
         agent_record = await self._store.complete_registration(
             body.registration_id
         )
+        if agent_record is None:
+            raise _ERR_REGISTRATION_NOT_FOUND
 
         return VerifyResponse(
             agent_id=agent_record.agent_id,
@@ -223,30 +315,31 @@ class AgentDoor:
         # Look up agent
         agent_record = await self._store.get_agent(body.agent_id)
         if agent_record is None:
-            raise HTTPException(status_code=401, detail="Unknown agent")
+            raise _ERR_UNKNOWN_AGENT
 
-        # Verify API key
-        if agent_record.api_key != body.api_key:
-            raise HTTPException(status_code=401, detail="Invalid API key")
+        # Verify API key (constant-time, to avoid a timing side channel;
+        # compare bytes, since compare_digest rejects non-ASCII str and
+        # the client controls this value)
+        if not hmac.compare_digest(
+            agent_record.api_key.encode("utf-8"), body.api_key.encode("utf-8")
+        ):
+            raise _ERR_INVALID_API_KEY
 
         # Verify timestamp freshness
         if not is_timestamp_valid(
             body.timestamp,
             max_drift_seconds=self._config.max_timestamp_drift,
         ):
-            raise HTTPException(
-                status_code=401,
-                detail="Timestamp outside acceptable range",
-            )
+            raise _ERR_STALE_TIMESTAMP
 
         # Verify signature on timestamp
-        if not verify_signature(
+        if not await _verify_signature_async(
             body.timestamp, body.signature, agent_record.public_key
         ):
-            raise HTTPException(status_code=401, detail="Invalid signature")
+            raise _ERR_INVALID_SIGNATURE
 
         # Issue token
-        token = f"agt_{secrets.token_urlsafe(32)}"
+        token = f"agt_{_token_urlsafe(32)}"
         expires_at = time.time() + self._config.token_ttl_seconds
 
         token_record = TokenRecord(
@@ -254,6 +347,7 @@ class AgentDoor:
             agent_id=agent_record.agent_id,
             expires_at=expires_at,
             scopes=agent_record.scopes,
+            agent_name=agent_record.agent_name,
         )
         await self._store.store_token(token_record)
 
@@ -286,44 +380,50 @@ class AgentDoor:
                 return {"agent": agent.agent_id}
         """
         store = self._store
+        required: frozenset[str] | None = frozenset(scopes) if scopes else None
 
         async def _dependency(request: Request) -> AgentContext:
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                raise HTTPException(
-                    status_code=401,
-                    detail="Missing or invalid Authorization header",
-                )
+            # Scan the raw ASGI header list instead of going through
+            # request.headers, which decodes and caches every header on
+            # first access.  Header names arrive lowercased per the ASGI
+            # spec, so a bytes comparison suffices.
+            raw_auth: bytes | None = None
+            for name, value in request.scope["headers"]:
+                if name == b"authorization":
+                    raw_auth = value
+                    break
+
+            if raw_auth is None or not raw_auth.startswith(b"Bearer ") or len(raw_auth) == 7:
+                raise _ERR_MISSING_AUTH
+
+            # Issued tokens always carry the "agt_" prefix, so random
+            # scanner strings are rejected here without touching the
+            # store at all.
+            if not raw_auth.startswith(b"agt_", 7):
+                raise _ERR_INVALID_TOKEN
+
+            # latin-1 matches Starlette's header decoding and cannot
+            # raise, unlike ascii.
+            token = raw_auth[7:].decode("latin-1")
 
-            token = auth_header[7:]  # Strip "Bearer " prefix
             token_record = await store.get_token(token)
 
             if token_record is None:
-                raise HTTPException(
-                    status_code=401,
-                    detail="Invalid or expired token",
-                )
+                raise _ERR_INVALID_TOKEN
 
             # Check scopes
-            if scopes:
-                missing = set(scopes) - set(token_record.scopes)
-                if missing:
-                    raise HTTPException(
-                        status_code=403,
-                        detail=f"Missing required scopes: {', '.join(sorted(missing))}",
-                    )
-
-            # Look up agent details
-            agent_record = await store.get_agent(token_record.agent_id)
-            if agent_record is None:
+            if required is not None and not required.issubset(token_record.scopes):
+                missing = required.difference(token_record.scopes)
                 raise HTTPException(
-                    status_code=401,
-                    detail="Agent not found",
+                    status_code=403,
+                    detail=f"Missing required scopes: {', '.join(sorted(missing))}",
                 )
 
+            # agent_name is denormalized onto the token at issue time,
+            # so no second store lookup is needed here.
             return AgentContext(
-                agent_id=agent_record.agent_id,
-                agent_name=agent_record.agent_name,
+                agent_id=token_record.agent_id,
+                agent_name=token_record.agent_name,
                 scopes=token_record.scopes,
             )
 
@@ -7,6 +7,8 @@ document and agent context models.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 
@@ -100,13 +102,19 @@ class AuthResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class AgentContext(BaseModel):
+@dataclass(frozen=True)
+class AgentContext:
     """Information about the authenticated agent.
 
     This is injected into protected route handlers via the
-    ``agent_required`` FastAPI dependency.
+    ``agent_required`` FastAPI dependency.  It is a plain slotted
+    dataclass rather than a Pydantic model: the server produced every
+    field itself, so there is nothing to validate on this per-request
+    path.
     """
 
+    __slots__ = ("agent_id", "agent_name", "scopes")
+
     agent_id: str
     agent_name: str
-    scopes: list[str] = Field(default_factory=list)
+    scopes: list[str]
@@ -0,0 +1,241 @@
+"""Shared fixtures for the AgentDoor FastAPI adapter tests."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import sys
+import time
+from functools import cache, lru_cache
+from typing import AsyncIterator, Iterator
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # SIMD-accelerated drop-in for the stdlib codec; falls back cleanly
+    # when not installed, so it stays out of the hard dependencies.
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from nacl.bindings import crypto_sign, crypto_sign_keypair, sodium_init
+
+# pynacl initializes libsodium on import, but make it explicit: an
+# uninitialized sodium falls back to slower, non-vectorized primitives.
+sodium_init()
+
+from agentdoor_fastapi import AgentDoor, AgentDoorConfig, AgentContext
+
+#: Number of Ed25519 keypairs pre-generated for the whole test session.
+#: Tests only need distinct keys, not freshly generated ones, and keygen
+#: is the single most expensive operation in this suite.
+_KEYPAIR_POOL_SIZE = 32
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+#: Default config for test apps, validated once at import.  AgentDoor
+#: never mutates its config (each instance builds its own store), so a
+#: single shared instance is safe.
+_DEFAULT_CONFIG = AgentDoorConfig(
+    service_name="Test Service",
+    scopes=[
+        {"name": "read", "description": "Read access"},
+        {"name": "write", "description": "Write access"},
+        {"name": "admin", "description": "Admin access"},
+    ],
+    token_ttl_seconds=3600,
+)
+
+
+def _json(resp: httpx.Response) -> dict:
+    """Parse a response body with orjson instead of httpx's stdlib path."""
+    return orjson.loads(resp.content)
+
+
+async def _post_json(
+    client: httpx.AsyncClient, path: str, payload: dict
+) -> httpx.Response:
+    """POST ``payload`` as pre-encoded JSON bytes.
+
+    Encoding with orjson and passing ``content=`` skips httpx's
+    per-request ``json.dumps`` + encode path.
+    """
+    return await client.post(
+        path, content=orjson.dumps(payload), headers=_JSON_HEADERS
+    )
+
+
+@lru_cache(maxsize=512)
+def _sign(message: str, signing_key: bytes) -> str:
+    """Sign a message and return the base64-encoded signature.
+
+    Goes straight through ``nacl.bindings.crypto_sign`` on the raw
+    secret-key bytes — no ``SigningKey`` allocation per call — and
+    slices the 64-byte detached signature off the combined output.
+    Ed25519 signing is deterministic, so repeated (message, key) pairs —
+    common when several tests reuse a shared fixture's challenge or
+    timestamp — are served from the LRU cache.
+    """
+    signed = crypto_sign(message.encode("utf-8"), signing_key)
+    return _b64encode(signed[:64]).decode()
+
+
+def _ts_sig(signing_key: bytes) -> tuple[str, str]:
+    """A current ``(timestamp, signature)`` pair for auth requests.
+
+    ``int(time.time())`` only changes once per second, so every call in
+    the same second hits the ``_sign`` cache instead of paying for a
+    fresh Ed25519 sign.
+    """
+    timestamp = str(int(time.time()))
+    return timestamp, _sign(timestamp, signing_key)
+
+
+def make_app(config: AgentDoorConfig | None = None) -> tuple[FastAPI, AgentDoor]:
+    """Create a test FastAPI app with AgentDoor mounted."""
+    app = FastAPI()
+    gate = AgentDoor(app, config=config or _DEFAULT_CONFIG)
+
+    @app.get("/protected")
+    async def protected(agent: AgentContext = Depends(gate.agent_required())):
+        return {"agent_id": agent.agent_id, "agent_name": agent.agent_name}
+
+    @app.get("/read-only")
+    async def read_only(
+        agent: AgentContext = Depends(gate.agent_required(scopes=["read"]))
+    ):
+        return {"ok": True}
+
+    @app.get("/admin-only")
+    async def admin_only(
+        agent: AgentContext = Depends(gate.agent_required(scopes=["admin"]))
+    ):
+        return {"ok": True}
+
+    return app, gate
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the suite on uvloop where available (not supported on Windows)."""
+    if uvloop is not None and sys.platform != "win32":
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def keypair_pool() -> Iterator[tuple[str, bytes]]:
+    """An endless cycle of pre-generated Ed25519 keypairs.
+
+    Each entry is ``(pub_b64, secret_key_bytes)``.  Keys come from
+    ``crypto_sign_keypair`` as raw bytes — nothing in the suite needs
+    the ``SigningKey`` wrapper, and only the public key ever crosses
+    the wire in base64 form.
+    """
+    pool = []
+    for _ in range(_KEYPAIR_POOL_SIZE):
+        pub, secret = crypto_sign_keypair()
+        pool.append((_b64encode(pub).decode(), secret))
+    return itertools.cycle(pool)
+
+
+@pytest.fixture
+def keypair(
+    keypair_pool: Iterator[tuple[str, bytes]],
+) -> tuple[str, bytes]:
+    """A ``(pub_b64, secret_key_bytes)`` tuple for one test."""
+    return next(keypair_pool)
+
+
+@cache
+def _default_app_cached() -> tuple[FastAPI, AgentDoor]:
+    return make_app()
+
+
+@pytest.fixture(scope="module")
+def default_app() -> tuple[FastAPI, AgentDoor]:
+    """The default-config app, built once per process.
+
+    Building the app re-runs FastAPI route registration and Pydantic
+    schema compilation, which dominates these sub-millisecond endpoint
+    tests, so one build is memoized and shared by every module (and
+    every test) in the worker.  Registrations from different tests are
+    independent, so sharing server state is safe.
+    """
+    return _default_app_cached()
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def client(
+    default_app: tuple[FastAPI, AgentDoor],
+) -> AsyncIterator[httpx.AsyncClient]:
+    """An async client for the shared default app.
+
+    Talks to the app in-process over an ASGI transport, avoiding the
+    per-request thread-portal hop that the sync TestClient pays, and
+    reuses one client (and event loop) across the whole module.
+    """
+    app, _ = default_app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as async_client:
+        yield async_client
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def registered_agent(
+    client: httpx.AsyncClient,
+    keypair_pool: Iterator[tuple[str, bytes]],
+) -> tuple[str, str, bytes]:
+    """An agent registered once per module.
+
+    Runs the register + verify handshake a single time and returns
+    ``(agent_id, api_key, signing_key)``.  Tests that only need *an*
+    authenticated identity share this instead of re-running the flow.
+    """
+    pub, signing_key = next(keypair_pool)
+
+    reg_resp = await _post_json(client, "/agentdoor/register", {
+        "agent_name": "test-agent",
+        "public_key": pub,
+        "scopes": ["read", "write"],
+    })
+    reg_data = _json(reg_resp)
+    challenge = reg_data["challenge"]
+    verify_resp = await _post_json(client, "/agentdoor/register/verify", {
+        "registration_id": reg_data["registration_id"],
+        "challenge": challenge,
+        "signature": _sign(challenge, signing_key),
+    })
+    verify_data = _json(verify_resp)
+    return verify_data["agent_id"], verify_data["api_key"], signing_key
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def bearer_token(
+    client: httpx.AsyncClient,
+    registered_agent: tuple[str, str, bytes],
+) -> str:
+    """A valid bearer token for the shared agent, minted once per module.
+
+    The default config's TTL (3600 s) comfortably outlives a test run,
+    so tests that just need *a* valid token share one sign + auth cycle.
+    """
+    agent_id, api_key, signing_key = registered_agent
+    timestamp, signature = _ts_sig(signing_key)
+    auth_resp = await _post_json(client, "/agentdoor/auth", {
+        "agent_id": agent_id,
+        "api_key": api_key,
+        "timestamp": timestamp,
+        "signature": signature,
+    })
+    return _json(auth_resp)["token"]
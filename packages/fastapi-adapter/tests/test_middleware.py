@@ -1,300 +1,246 @@
 """Tests for the AgentDoor FastAPI middleware.
 
-Uses FastAPI TestClient (backed by httpx) to exercise the full
-registration, verification, and authentication flow.
+Exercises the full registration, verification, and authentication flow
+in-process through ``httpx.AsyncClient`` over an ASGI transport.  The
+default app and client come from module-scoped fixtures in
+``conftest.py``; only tests that need a divergent config build their
+own app.
 """
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import gc
 import time
+import weakref
 
+import httpx
 import pytest
-from fastapi import Depends, FastAPI
-from fastapi.testclient import TestClient
-from nacl.signing import SigningKey
+import pytest_asyncio
+from fastapi import FastAPI
 
-from agentdoor_fastapi import AgentDoor, AgentDoorConfig, AgentContext
+from agentdoor_fastapi import AgentDoor, AgentDoorConfig
+from agentdoor_fastapi.store import InMemoryAgentStore, TokenRecord
 
+from .conftest import _json, _post_json, _sign, _ts_sig, make_app
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-def _generate_keypair() -> tuple[str, str, SigningKey]:
-    """Generate an Ed25519 keypair and return (pub_b64, sec_b64, signing_key)."""
-    signing_key = SigningKey.generate()
-    pub_b64 = base64.b64encode(signing_key.verify_key.encode()).decode()
-    sec_b64 = base64.b64encode(signing_key.encode()).decode()
-    return pub_b64, sec_b64, signing_key
-
-
-def _sign(message: str, signing_key: SigningKey) -> str:
-    """Sign a message and return the base64-encoded signature."""
-    signed = signing_key.sign(message.encode("utf-8"))
-    return base64.b64encode(signed.signature).decode()
-
-
-def _create_app(config: AgentDoorConfig | None = None) -> tuple[FastAPI, AgentDoor]:
-    """Create a test FastAPI app with AgentDoor mounted."""
-    app = FastAPI()
-    cfg = config or AgentDoorConfig(
-        service_name="Test Service",
-        scopes=[
-            {"name": "read", "description": "Read access"},
-            {"name": "write", "description": "Write access"},
-        ],
-        token_ttl_seconds=3600,
-    )
-    gate = AgentDoor(app, config=cfg)
-
-    @app.get("/protected")
-    async def protected(agent: AgentContext = Depends(gate.agent_required())):
-        return {"agent_id": agent.agent_id, "agent_name": agent.agent_name}
-
-    @app.get("/read-only")
-    async def read_only(
-        agent: AgentContext = Depends(gate.agent_required(scopes=["read"]))
-    ):
-        return {"ok": True}
-
-    return app, gate
-
-
-# ---------------------------------------------------------------------------
-# Tests
-# ---------------------------------------------------------------------------
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def discovery_doc(client: httpx.AsyncClient) -> dict:
+    """The discovery document, fetched once and shared by all assertions."""
+    resp = await client.get("/.well-known/agentdoor.json")
+    assert resp.status_code == 200
+    return _json(resp)
 
 
 class TestDiscovery:
     """Tests for GET /.well-known/agentdoor.json."""
 
-    def test_returns_discovery_document(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        resp = client.get("/.well-known/agentdoor.json")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["service_name"] == "Test Service"
-        assert data["agentdoor_version"] == "0.1"
-        assert data["registration_endpoint"] == "/agentdoor/register"
-        assert data["verification_endpoint"] == "/agentdoor/register/verify"
-        assert data["auth_endpoint"] == "/agentdoor/auth"
-        assert len(data["scopes"]) == 2
+    @pytest.mark.parametrize(("key", "expected"), [
+        ("service_name", "Test Service"),
+        ("agentdoor_version", "0.1"),
+        ("registration_endpoint", "/agentdoor/register"),
+        ("verification_endpoint", "/agentdoor/register/verify"),
+        ("auth_endpoint", "/agentdoor/auth"),
+        ("token_ttl_seconds", 3600),
+    ])
+    async def test_discovery_fields(
+        self, discovery_doc: dict, key: str, expected: object
+    ) -> None:
+        assert discovery_doc[key] == expected
 
-    def test_token_ttl_in_discovery(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        resp = client.get("/.well-known/agentdoor.json")
-        assert resp.json()["token_ttl_seconds"] == 3600
+    async def test_discovery_lists_scopes(self, discovery_doc: dict) -> None:
+        assert len(discovery_doc["scopes"]) == 3
 
 
 class TestRegistration:
     """Tests for the registration flow."""
 
-    def test_register_returns_challenge(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, _ = _generate_keypair()
+    async def test_register_returns_challenge(self, client: httpx.AsyncClient, keypair) -> None:
+        pub, _ = keypair
 
-        resp = client.post("/agentdoor/register", json={
+        resp = await _post_json(client, "/agentdoor/register", {
             "agent_name": "test-agent",
             "public_key": pub,
             "scopes": ["read"],
         })
         assert resp.status_code == 200
-        data = resp.json()
+        data = _json(resp)
         assert "registration_id" in data
         assert "challenge" in data
 
-    def test_register_invalid_scopes(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, _ = _generate_keypair()
+    async def test_register_invalid_scopes(self, client: httpx.AsyncClient, keypair) -> None:
+        pub, _ = keypair
 
-        resp = client.post("/agentdoor/register", json={
+        resp = await _post_json(client, "/agentdoor/register", {
             "agent_name": "test-agent",
             "public_key": pub,
             "scopes": ["nonexistent"],
         })
         assert resp.status_code == 400
-        assert "Invalid scopes" in resp.json()["detail"]
+        assert "Invalid scopes" in _json(resp)["detail"]
 
 
 class TestVerification:
     """Tests for the verification endpoint."""
 
-    def test_full_registration_flow(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
+    async def test_full_registration_flow(self, client: httpx.AsyncClient, keypair) -> None:
+        pub, signing_key = keypair
 
         # Step 1: Register
-        reg_resp = client.post("/agentdoor/register", json={
+        reg_resp = await _post_json(client, "/agentdoor/register", {
             "agent_name": "test-agent",
             "public_key": pub,
             "scopes": ["read"],
         })
         assert reg_resp.status_code == 200
-        reg_data = reg_resp.json()
+        reg_data = _json(reg_resp)
 
         # Step 2: Sign challenge and verify
         challenge = reg_data["challenge"]
         signature = _sign(challenge, signing_key)
 
-        verify_resp = client.post("/agentdoor/register/verify", json={
+        verify_resp = await _post_json(client, "/agentdoor/register/verify", {
             "registration_id": reg_data["registration_id"],
             "challenge": challenge,
             "signature": signature,
         })
         assert verify_resp.status_code == 200
-        verify_data = verify_resp.json()
+        verify_data = _json(verify_resp)
         assert "agent_id" in verify_data
         assert "api_key" in verify_data
 
-    def test_verify_invalid_registration_id(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-
-        resp = client.post("/agentdoor/register/verify", json={
+    async def test_verify_invalid_registration_id(self, client: httpx.AsyncClient) -> None:
+        resp = await _post_json(client, "/agentdoor/register/verify", {
             "registration_id": "nonexistent",
             "challenge": "whatever",
             "signature": "whatever",
         })
         assert resp.status_code == 404
 
-    def test_verify_wrong_signature(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
+    async def test_verify_wrong_signature(self, client: httpx.AsyncClient, keypair) -> None:
+        pub, signing_key = keypair
 
         # Register
-        reg_resp = client.post("/agentdoor/register", json={
+        reg_resp = await _post_json(client, "/agentdoor/register", {
             "agent_name": "test-agent",
             "public_key": pub,
             "scopes": ["read"],
         })
-        reg_data = reg_resp.json()
+        reg_data = _json(reg_resp)
 
         # Sign wrong message
         wrong_signature = _sign("wrong-message", signing_key)
 
-        verify_resp = client.post("/agentdoor/register/verify", json={
+        verify_resp = await _post_json(client, "/agentdoor/register/verify", {
             "registration_id": reg_data["registration_id"],
             "challenge": reg_data["challenge"],
             "signature": wrong_signature,
         })
         assert verify_resp.status_code == 401
 
-    def test_verify_challenge_mismatch(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
+    async def test_verify_challenge_mismatch(self, client: httpx.AsyncClient, keypair) -> None:
+        pub, signing_key = keypair
 
-        reg_resp = client.post("/agentdoor/register", json={
+        reg_resp = await _post_json(client, "/agentdoor/register", {
             "agent_name": "test-agent",
             "public_key": pub,
             "scopes": ["read"],
         })
-        reg_data = reg_resp.json()
+        reg_data = _json(reg_resp)
 
         # Send wrong challenge
         signature = _sign("wrong-challenge", signing_key)
-        verify_resp = client.post("/agentdoor/register/verify", json={
+        verify_resp = await _post_json(client, "/agentdoor/register/verify", {
             "registration_id": reg_data["registration_id"],
             "challenge": "wrong-challenge",
             "signature": signature,
         })
         assert verify_resp.status_code == 400
 
+    async def test_verify_non_ascii_challenge_rejected(
+        self, client: httpx.AsyncClient, keypair
+    ) -> None:
+        pub, signing_key = keypair
 
-class TestAuthentication:
-    """Tests for the auth endpoint."""
-
-    def _register_agent(
-        self, client: TestClient, signing_key: SigningKey, pub: str
-    ) -> dict:
-        """Helper: run the full registration flow and return verify data."""
-        reg_resp = client.post("/agentdoor/register", json={
+        reg_resp = await _post_json(client, "/agentdoor/register", {
             "agent_name": "test-agent",
             "public_key": pub,
-            "scopes": ["read", "write"],
+            "scopes": ["read"],
         })
-        reg_data = reg_resp.json()
-        challenge = reg_data["challenge"]
-        signature = _sign(challenge, signing_key)
-        verify_resp = client.post("/agentdoor/register/verify", json={
+        reg_data = _json(reg_resp)
+
+        # compare_digest rejects non-ASCII str; this must stay a clean
+        # 400 mismatch, not a 500
+        signature = _sign("café", signing_key)
+        verify_resp = await _post_json(client, "/agentdoor/register/verify", {
             "registration_id": reg_data["registration_id"],
-            "challenge": challenge,
+            "challenge": "café",
             "signature": signature,
         })
-        return verify_resp.json()
+        assert verify_resp.status_code == 400
 
-    def test_auth_returns_token(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
-        agent_data = self._register_agent(client, signing_key, pub)
 
-        timestamp = str(int(time.time()))
-        signature = _sign(timestamp, signing_key)
+class TestAuthentication:
+    """Tests for the auth endpoint.
+
+    Uses the module-scoped ``registered_agent`` fixture: the auth
+    endpoint does not mutate the agent record, so one registration can
+    back every test here.
+    """
 
-        auth_resp = client.post("/agentdoor/auth", json={
-            "agent_id": agent_data["agent_id"],
-            "api_key": agent_data["api_key"],
+    async def test_auth_returns_token(self, client: httpx.AsyncClient, registered_agent) -> None:
+        agent_id, api_key, signing_key = registered_agent
+
+        timestamp, signature = _ts_sig(signing_key)
+
+        auth_resp = await _post_json(client, "/agentdoor/auth", {
+            "agent_id": agent_id,
+            "api_key": api_key,
             "timestamp": timestamp,
             "signature": signature,
         })
         assert auth_resp.status_code == 200
-        auth_data = auth_resp.json()
+        auth_data = _json(auth_resp)
         assert "token" in auth_data
         assert auth_data["expires_in"] == 3600
 
-    def test_auth_wrong_api_key(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
-        agent_data = self._register_agent(client, signing_key, pub)
+    async def test_auth_wrong_api_key(self, client: httpx.AsyncClient, registered_agent) -> None:
+        agent_id, _, signing_key = registered_agent
 
-        timestamp = str(int(time.time()))
-        signature = _sign(timestamp, signing_key)
+        timestamp, signature = _ts_sig(signing_key)
 
-        auth_resp = client.post("/agentdoor/auth", json={
-            "agent_id": agent_data["agent_id"],
+        auth_resp = await _post_json(client, "/agentdoor/auth", {
+            "agent_id": agent_id,
             "api_key": "wrong-key",
             "timestamp": timestamp,
             "signature": signature,
         })
         assert auth_resp.status_code == 401
 
-    def test_auth_stale_timestamp(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
-        agent_data = self._register_agent(client, signing_key, pub)
+    async def test_auth_stale_timestamp(self, client: httpx.AsyncClient, registered_agent) -> None:
+        agent_id, api_key, signing_key = registered_agent
 
         # Timestamp from 10 minutes ago (outside 5-minute window)
         stale_timestamp = str(int(time.time()) - 600)
         signature = _sign(stale_timestamp, signing_key)
 
-        auth_resp = client.post("/agentdoor/auth", json={
-            "agent_id": agent_data["agent_id"],
-            "api_key": agent_data["api_key"],
+        auth_resp = await _post_json(client, "/agentdoor/auth", {
+            "agent_id": agent_id,
+            "api_key": api_key,
             "timestamp": stale_timestamp,
             "signature": signature,
         })
         assert auth_resp.status_code == 401
 
-    def test_auth_unknown_agent(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        _, _, signing_key = _generate_keypair()
+    async def test_auth_unknown_agent(self, client: httpx.AsyncClient, keypair) -> None:
+        _, signing_key = keypair
 
-        timestamp = str(int(time.time()))
-        signature = _sign(timestamp, signing_key)
+        timestamp, signature = _ts_sig(signing_key)
 
-        auth_resp = client.post("/agentdoor/auth", json={
+        auth_resp = await _post_json(client, "/agentdoor/auth", {
             "agent_id": "nonexistent",
             "api_key": "whatever",
             "timestamp": timestamp,
@@ -303,183 +249,129 @@ class TestAuthentication:
         assert auth_resp.status_code == 401
 
 
-class TestProtectedRoutes:
-    """Tests for agent_required dependency on protected routes."""
-
-    def _get_token(
-        self, client: TestClient, signing_key: SigningKey, pub: str
-    ) -> str:
-        """Helper: register + authenticate and return a bearer token."""
-        reg_resp = client.post("/agentdoor/register", json={
-            "agent_name": "test-agent",
-            "public_key": pub,
-            "scopes": ["read", "write"],
-        })
-        reg_data = reg_resp.json()
-        challenge = reg_data["challenge"]
-        sig = _sign(challenge, signing_key)
-        verify_resp = client.post("/agentdoor/register/verify", json={
-            "registration_id": reg_data["registration_id"],
-            "challenge": challenge,
-            "signature": sig,
-        })
-        verify_data = verify_resp.json()
+class TestBatchedFlow:
+    """The registration flow driven as concurrent bursts.
+
+    Exercises the same register → verify → auth sequence as the tests
+    above, but submits each stage for several agents at once through
+    ``asyncio.gather``, checking that interleaved handshakes do not
+    cross wires.
+    """
+
+    _BURST_SIZE = 8
+
+    async def test_concurrent_registration_flow(
+        self, client: httpx.AsyncClient, keypair_pool
+    ) -> None:
+        keys = [next(keypair_pool) for _ in range(self._BURST_SIZE)]
+
+        reg_resps = await asyncio.gather(*[
+            _post_json(client, "/agentdoor/register", {
+                "agent_name": f"batch-agent-{i}",
+                "public_key": pub,
+                "scopes": ["read"],
+            })
+            for i, (pub, _) in enumerate(keys)
+        ])
+        assert all(r.status_code == 200 for r in reg_resps)
+        reg_datas = [_json(r) for r in reg_resps]
+
+        verify_resps = await asyncio.gather(*[
+            _post_json(client, "/agentdoor/register/verify", {
+                "registration_id": reg["registration_id"],
+                "challenge": reg["challenge"],
+                "signature": _sign(reg["challenge"], signing_key),
+            })
+            for reg, (_, signing_key) in zip(reg_datas, keys)
+        ])
+        assert all(r.status_code == 200 for r in verify_resps)
+        verify_datas = [_json(r) for r in verify_resps]
 
         timestamp = str(int(time.time()))
-        ts_sig = _sign(timestamp, signing_key)
-        auth_resp = client.post("/agentdoor/auth", json={
-            "agent_id": verify_data["agent_id"],
-            "api_key": verify_data["api_key"],
-            "timestamp": timestamp,
-            "signature": ts_sig,
-        })
-        return auth_resp.json()["token"]
+        auth_resps = await asyncio.gather(*[
+            _post_json(client, "/agentdoor/auth", {
+                "agent_id": verify["agent_id"],
+                "api_key": verify["api_key"],
+                "timestamp": timestamp,
+                "signature": _sign(timestamp, signing_key),
+            })
+            for verify, (_, signing_key) in zip(verify_datas, keys)
+        ])
+        assert all(r.status_code == 200 for r in auth_resps)
+
+        tokens = [_json(r)["token"] for r in auth_resps]
+        assert len(set(tokens)) == self._BURST_SIZE
+
 
-    def test_protected_route_with_valid_token(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
-        token = self._get_token(client, signing_key, pub)
+class TestProtectedRoutes:
+    """Tests for agent_required dependency on protected routes."""
 
-        resp = client.get("/protected", headers={"Authorization": f"Bearer {token}"})
+    async def test_protected_route_with_valid_token(self, client: httpx.AsyncClient, bearer_token: str) -> None:
+        resp = await client.get("/protected", headers={"Authorization": f"Bearer {bearer_token}"})
         assert resp.status_code == 200
-        data = resp.json()
+        data = _json(resp)
         assert "agent_id" in data
         assert data["agent_name"] == "test-agent"
 
-    def test_protected_route_without_token(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-
-        resp = client.get("/protected")
+    @pytest.mark.parametrize("headers", [
+        pytest.param({}, id="missing"),
+        pytest.param({"Authorization": "Bearer invalid-token"}, id="invalid"),
+    ])
+    async def test_protected_route_rejects_bad_auth(
+        self, client: httpx.AsyncClient, headers: dict
+    ) -> None:
+        resp = await client.get("/protected", headers=headers)
         assert resp.status_code == 401
 
-    def test_protected_route_with_invalid_token(self) -> None:
-        app, _ = _create_app()
-        client = TestClient(app)
-
-        resp = client.get(
-            "/protected",
-            headers={"Authorization": "Bearer invalid-token"},
-        )
-        assert resp.status_code == 401
-
-    def test_scope_enforcement(self) -> None:
+    async def test_scope_enforcement(self, client: httpx.AsyncClient, bearer_token: str) -> None:
         """Agent with read+write scopes can access read-only route."""
-        app, _ = _create_app()
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
-        token = self._get_token(client, signing_key, pub)
-
-        resp = client.get(
+        resp = await client.get(
             "/read-only",
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {bearer_token}"},
         )
         assert resp.status_code == 200
 
-    def test_scope_enforcement_missing_scope(self) -> None:
-        """Agent missing a required scope gets 403."""
-        app = FastAPI()
-        cfg = AgentDoorConfig(
-            service_name="Test",
-            scopes=[
-                {"name": "read", "description": "Read"},
-                {"name": "admin", "description": "Admin"},
-            ],
-        )
-        gate = AgentDoor(app, config=cfg)
-
-        @app.get("/admin-only")
-        async def admin_only(
-            agent: AgentContext = Depends(gate.agent_required(scopes=["admin"]))
-        ):
-            return {"ok": True}
-
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
-
-        # Register with only "read" scope
-        reg_resp = client.post("/agentdoor/register", json={
-            "agent_name": "limited-agent",
-            "public_key": pub,
-            "scopes": ["read"],
-        })
-        reg_data = reg_resp.json()
-        challenge = reg_data["challenge"]
-        sig = _sign(challenge, signing_key)
-        verify_resp = client.post("/agentdoor/register/verify", json={
-            "registration_id": reg_data["registration_id"],
-            "challenge": challenge,
-            "signature": sig,
-        })
-        verify_data = verify_resp.json()
-
-        timestamp = str(int(time.time()))
-        ts_sig = _sign(timestamp, signing_key)
-        auth_resp = client.post("/agentdoor/auth", json={
-            "agent_id": verify_data["agent_id"],
-            "api_key": verify_data["api_key"],
-            "timestamp": timestamp,
-            "signature": ts_sig,
-        })
-        token = auth_resp.json()["token"]
+    async def test_scope_enforcement_missing_scope(
+        self, client: httpx.AsyncClient, bearer_token: str
+    ) -> None:
+        """Agent missing a required scope gets 403.
 
-        resp = client.get(
+        The shared agent holds read+write but not admin, so the shared
+        app's /admin-only route rejects it — no dedicated app needed.
+        """
+        resp = await client.get(
             "/admin-only",
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {bearer_token}"},
         )
         assert resp.status_code == 403
-        assert "admin" in resp.json()["detail"]
-
-    def test_expired_token_rejected(self) -> None:
-        """An expired token should return 401."""
-        app = FastAPI()
-        cfg = AgentDoorConfig(
-            service_name="Test",
-            scopes=[{"name": "read", "description": "Read"}],
-            token_ttl_seconds=0,  # Tokens expire immediately
-        )
-        gate = AgentDoor(app, config=cfg)
-
-        @app.get("/protected")
-        async def protected(
-            agent: AgentContext = Depends(gate.agent_required())
-        ):
-            return {"ok": True}
-
-        client = TestClient(app)
-        pub, _, signing_key = _generate_keypair()
-
-        # Full registration
-        reg_resp = client.post("/agentdoor/register", json={
-            "agent_name": "test-agent",
-            "public_key": pub,
-            "scopes": ["read"],
-        })
-        reg_data = reg_resp.json()
-        challenge = reg_data["challenge"]
-        sig = _sign(challenge, signing_key)
-        verify_resp = client.post("/agentdoor/register/verify", json={
-            "registration_id": reg_data["registration_id"],
-            "challenge": challenge,
-            "signature": sig,
-        })
-        verify_data = verify_resp.json()
-
-        timestamp = str(int(time.time()))
-        ts_sig = _sign(timestamp, signing_key)
-        auth_resp = client.post("/agentdoor/auth", json={
-            "agent_id": verify_data["agent_id"],
-            "api_key": verify_data["api_key"],
-            "timestamp": timestamp,
-            "signature": ts_sig,
-        })
-        token = auth_resp.json()["token"]
-
-        # Wait for token to expire (TTL is 0)
-        time.sleep(0.1)
-
-        resp = client.get(
+        assert "admin" in _json(resp)["detail"]
+
+    async def test_expired_token_rejected(
+        self,
+        client: httpx.AsyncClient,
+        default_app: tuple[FastAPI, AgentDoor],
+        registered_agent,
+    ) -> None:
+        """An expired token should return 401.
+
+        Rather than configuring a zero TTL and waiting a token out,
+        store a record whose expiry is already in the past and present
+        it — one store insert instead of a dedicated app plus a full
+        handshake.
+        """
+        _, gate = default_app
+        agent_id, _, _ = registered_agent
+
+        token = f"agt_{'0' * 43}"
+        await gate.store.store_token(TokenRecord(
+            token=token,
+            agent_id=agent_id,
+            expires_at=time.time() - 60.0,
+            scopes=["read"],
+            agent_name="test-agent",
+        ))
+
+        resp = await client.get(
             "/protected",
             headers={"Authorization": f"Bearer {token}"},
         )
@@ -489,30 +381,53 @@ class TestProtectedRoutes:
 class TestCustomRoutePrefix:
     """Tests for custom route prefix configuration."""
 
-    def test_custom_prefix(self) -> None:
+    async def test_custom_prefix(self, keypair) -> None:
         """Routes should use the custom prefix."""
-        app = FastAPI()
         cfg = AgentDoorConfig(
             service_name="Custom",
             scopes=[{"name": "read", "description": "Read"}],
             route_prefix="/custom/auth",
         )
-        AgentDoor(app, config=cfg)
-
-        client = TestClient(app)
-
-        # Discovery should reflect custom prefix
-        resp = client.get("/.well-known/agentdoor.json")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["registration_endpoint"] == "/custom/auth/register"
-        assert data["auth_endpoint"] == "/custom/auth/auth"
-
-        # Register should work at custom path
-        pub, _, _ = _generate_keypair()
-        reg_resp = client.post("/custom/auth/register", json={
-            "agent_name": "test-agent",
-            "public_key": pub,
-            "scopes": ["read"],
-        })
-        assert reg_resp.status_code == 200
+        app, _ = make_app(config=cfg)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+
+            # Discovery should reflect custom prefix
+            resp = await client.get("/.well-known/agentdoor.json")
+            assert resp.status_code == 200
+            data = _json(resp)
+            assert data["registration_endpoint"] == "/custom/auth/register"
+            assert data["auth_endpoint"] == "/custom/auth/auth"
+
+            # Register should work at custom path
+            pub, _ = keypair
+            reg_resp = await _post_json(client, "/custom/auth/register", {
+                "agent_name": "test-agent",
+                "public_key": pub,
+                "scopes": ["read"],
+            })
+            assert reg_resp.status_code == 200
+
+
+class TestStoreClock:
+    """Tests for the in-memory store's cached-clock lifecycle."""
+
+    async def test_close_cancels_clock(self) -> None:
+        """close() should cancel the pending tick."""
+        store = InMemoryAgentStore()
+        await store.get_token("missing")
+        assert store._clock_handle is not None
+        store.close()
+        assert store._clock_handle is None
+
+    async def test_dropped_store_is_collectable(self) -> None:
+        """The armed tick must not keep an abandoned store alive."""
+        store = InMemoryAgentStore()
+        await store.get_token("missing")
+        ref = weakref.ref(store)
+        del store
+        gc.collect()
+        assert ref() is None
@@ -7,33 +7,61 @@ that implement the AgentDoor protocol.
 
 from __future__ import annotations
 
+import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+try:
+    # C-extension JSON encoder emitting bytes directly; optional, with
+    # httpx's stdlib json= path as the fallback.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from .credentials import Credential, CredentialStore, InMemoryCredentialStore
 from .crypto import generate_keypair, sign_message
 from .discovery import DiscoveryDocument, discover
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
+_uvloop_installed = False
+
+
+def _install_uvloop() -> None:
+    """Install uvloop's event loop policy once per process."""
+    global _uvloop_installed
+    if _uvloop_installed:
+        return
+    import uvloop
 
-@dataclass
+    uvloop.install()
+    _uvloop_installed = True
+
+
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an Agent instance.
 
     Attributes:
         agent_name: Human-readable name for this agent.
-        credential_store: Where to persist credentials.  Defaults to
-            an in-memory store.
+        credential_store: Where to persist credentials.  ``None`` (the
+            default) gives each Agent its own in-memory store, so
+            configs can be shared between agents without also sharing
+            credentials.
         http_timeout: Timeout in seconds for HTTP requests.
+        use_uvloop: Install uvloop's event loop policy when the first
+            Agent is constructed.  Worthwhile when one process drives
+            many agents; requires the optional ``uvloop`` package and
+            is ignored on Windows.
     """
 
     agent_name: str = "agentdoor-python-sdk"
-    credential_store: CredentialStore = field(
-        default_factory=InMemoryCredentialStore
-    )
+    credential_store: CredentialStore | None = None
     http_timeout: float = 30.0
+    use_uvloop: bool = False
 
 
 class Agent:
@@ -49,10 +77,30 @@ class Agent:
 
     def __init__(self, config: AgentConfig | None = None) -> None:
         self._config = config or AgentConfig()
+        if self._config.use_uvloop and sys.platform != "win32":
+            _install_uvloop()
+        # Allocated lazily so that AgentConfig() defaults stay cheap to
+        # construct and safe to share.
+        self._store = self._config.credential_store or InMemoryCredentialStore()
         self._client: httpx.AsyncClient | None = None
         self._base_url: str | None = None
         self._discovery: DiscoveryDocument | None = None
         self._credential: Credential | None = None
+        # Flattened auth state, primed by _prime_auth_cache().  These
+        # mirror fields on the credential and discovery document so the
+        # per-request authenticate() path avoids chained attribute
+        # lookups through those objects.
+        self._auth_url: str | None = None
+        self._agent_id: str | None = None
+        self._api_key: str | None = None
+        self._secret_key: str | None = None
+        self._token: str | None = None
+        self._token_expiry: float = 0.0
+        self._bearer: str | None = None
+        # Signing timestamps have 1-second granularity, so the str()
+        # result is reused within the same wall-second.
+        self._last_ts_second: int = 0
+        self._last_ts_str: str = ""
 
     # ------------------------------------------------------------------
     # Properties
@@ -103,14 +151,22 @@ class Agent:
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=self._config.http_timeout,
+            # The discovery fetch opens the connection; generous
+            # keep-alive lets register/verify/auth and subsequent
+            # requests reuse it instead of paying TCP+TLS setup again.
+            limits=httpx.Limits(
+                max_keepalive_connections=4, keepalive_expiry=60.0
+            ),
         )
 
         # Check credential store for cached credential
-        cached = self._config.credential_store.get(self._base_url)
+        cached = self._store.get(self._base_url)
         if cached is not None:
             self._credential = cached
 
         self._discovery = await discover(self._base_url, client=self._client)
+        if self._credential is not None:
+            self._prime_auth_cache()
         return self._discovery
 
     async def register(self, scopes: list[str] | None = None) -> Credential:
@@ -141,6 +197,11 @@ class Agent:
         if self._credential is not None and self._credential.api_key is not None:
             return self._credential
 
+        # Intern and sort the scope names: servers key scope checks by
+        # these exact strings, so interned copies hit the pointer-equality
+        # fast path in dict/set lookups on both ends.
+        scopes_tuple = tuple(sorted(sys.intern(s) for s in scopes or ()))
+
         # Generate a fresh keypair
         public_key, secret_key = generate_keypair()
 
@@ -149,10 +210,11 @@ class Agent:
         reg_payload = {
             "agent_name": self._config.agent_name,
             "public_key": public_key,
-            "scopes": scopes or [],
+            "scopes": scopes_tuple,
         }
-        reg_response = await self._client.post(reg_url, json=reg_payload)
-        reg_response.raise_for_status()
+        reg_response = await self._post_json(reg_url, reg_payload)
+        if not reg_response.is_success:
+            reg_response.raise_for_status()
         reg_data = reg_response.json()
 
         challenge: str = reg_data["challenge"]
@@ -166,8 +228,9 @@ class Agent:
             "challenge": challenge,
             "signature": signature,
         }
-        verify_response = await self._client.post(verify_url, json=verify_payload)
-        verify_response.raise_for_status()
+        verify_response = await self._post_json(verify_url, verify_payload)
+        if not verify_response.is_success:
+            verify_response.raise_for_status()
         verify_data = verify_response.json()
 
         api_key: str = verify_data["api_key"]
@@ -180,11 +243,37 @@ class Agent:
             public_key=public_key,
             secret_key=secret_key,
             api_key=api_key,
-            scopes=scopes or [],
+            scopes=list(scopes_tuple),
         )
-        self._config.credential_store.save(self._credential)
+        self._store.save(self._credential)
+        self._prime_auth_cache()
         return self._credential
 
+    async def _post_json(self, url: str, payload: dict) -> httpx.Response:
+        """POST a JSON payload, pre-encoded with orjson when available."""
+        assert self._client is not None
+        if orjson is not None:
+            return await self._client.post(
+                url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+            )
+        return await self._client.post(url, json=payload)
+
+    def _prime_auth_cache(self) -> None:
+        """Flatten credential and discovery state for the auth hot path."""
+        assert self._credential is not None and self._discovery is not None
+        self._auth_url = self._discovery.auth_endpoint
+        self._agent_id = self._credential.agent_id
+        self._api_key = self._credential.api_key
+        self._secret_key = self._credential.secret_key
+        if self._credential.is_token_valid():
+            self._token = self._credential.token
+            self._token_expiry = self._credential.token_expires_at or 0.0
+            self._bearer = f"Bearer {self._token}"
+        else:
+            self._token = None
+            self._token_expiry = 0.0
+            self._bearer = None
+
     async def authenticate(self) -> str:
         """Obtain a short-lived authentication token.
 
@@ -198,6 +287,11 @@ class Agent:
             RuntimeError: If the agent is not registered.
             httpx.HTTPStatusError: On server error responses.
         """
+        # Fast path: cached token still valid (same 30 s expiry buffer
+        # as Credential.is_token_valid, without the credential lookups).
+        if self._token is not None and time.time() < self._token_expiry - 30.0:
+            return self._token
+
         if (
             self._credential is None
             or self._credential.api_key is None
@@ -206,23 +300,31 @@ class Agent:
         ):
             raise RuntimeError("Must call register() before authenticate()")
 
-        # Return cached token if still valid
-        if self._credential.is_token_valid():
-            assert self._credential.token is not None
-            return self._credential.token
-
-        timestamp = str(int(time.time()))
-        signature = sign_message(timestamp, self._credential.secret_key)
+        # (Re)prime the flattened cache on the slow path; this also picks
+        # up credentials swapped in from outside (e.g. by tests) and any
+        # still-valid token they carry.
+        self._prime_auth_cache()
+        if self._token is not None and time.time() < self._token_expiry - 30.0:
+            return self._token
+
+        now = int(time.time())
+        if now == self._last_ts_second:
+            timestamp = self._last_ts_str
+        else:
+            self._last_ts_second = now
+            timestamp = self._last_ts_str = str(now)
+        assert self._secret_key is not None
+        signature = sign_message(timestamp, self._secret_key)
 
-        auth_url = self._discovery.auth_endpoint
         auth_payload = {
-            "agent_id": self._credential.agent_id,
-            "api_key": self._credential.api_key,
+            "agent_id": self._agent_id,
+            "api_key": self._api_key,
             "timestamp": timestamp,
             "signature": signature,
         }
-        auth_response = await self._client.post(auth_url, json=auth_payload)
-        auth_response.raise_for_status()
+        auth_response = await self._post_json(self._auth_url, auth_payload)
+        if not auth_response.is_success:
+            auth_response.raise_for_status()
         auth_data = auth_response.json()
 
         token: str = auth_data["token"]
@@ -231,8 +333,11 @@ class Agent:
         )
 
         self._credential.token = token
-        self._credential.token_expires_at = time.time() + expires_in
-        self._config.credential_store.save(self._credential)
+        self._credential.token_expires_at = now + expires_in
+        self._token = token
+        self._token_expiry = self._credential.token_expires_at
+        self._bearer = f"Bearer {token}"
+        self._store.save(self._credential)
 
         return token
 
@@ -262,10 +367,15 @@ class Agent:
         if self._client is None:
             raise RuntimeError("Must call connect() before request()")
 
-        token = await self.authenticate()
+        await self.authenticate()
 
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {token}"
+        # The full header value is cached next to the token, so steady-
+        # state requests skip re-formatting it.
+        headers = kwargs.pop("headers", None)
+        if headers is None:
+            headers = {"Authorization": self._bearer}
+        else:
+            headers["Authorization"] = self._bearer
 
         response = await self._client.request(method, path, headers=headers, **kwargs)
 
@@ -274,8 +384,11 @@ class Agent:
             # Force token refresh
             self._credential.token = None  # type: ignore[union-attr]
             self._credential.token_expires_at = None  # type: ignore[union-attr]
-            token = await self.authenticate()
-            headers["Authorization"] = f"Bearer {token}"
+            self._token = None
+            self._token_expiry = 0.0
+            self._bearer = None
+            await self.authenticate()
+            headers["Authorization"] = self._bearer
             response = await self._client.request(
                 method, path, headers=headers, **kwargs
             )
@@ -8,13 +8,38 @@ from __future__ import annotations
 
 import json
 import os
+import sys
+import time
+
+try:
+    # C-extension JSON codec; optional, with the stdlib module as the
+    # fallback.  orjson.OPT_INDENT_2 keeps the on-disk format readable
+    # either way.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Sequence
+
 
+@lru_cache(maxsize=128)
+def _normalize(url: str) -> str:
+    """Normalize a service URL into its store key.
+
+    Agents hit the store with the same handful of URLs over and over,
+    so the rstrip (and its string allocation) is paid once per URL.
+    Interning the result lets dict lookups on the store short-circuit
+    on pointer equality.
+    """
+    return sys.intern(url.rstrip("/"))
 
-@dataclass
+
+@dataclass(slots=True)
 class Credential:
     """Stored credential for an agent identity on a specific service."""
 
@@ -37,22 +62,40 @@ class Credential:
         Returns:
             ``True`` if a token is present and has not expired.
         """
-        if self.token is None or self.token_expires_at is None:
-            return False
-        if now is None:
-            import time
-            now = time.time()
-        # Add a small buffer (30 seconds) to avoid using nearly-expired tokens
-        return now < (self.token_expires_at - 30)
+        expires_at = self.token_expires_at
+        # Single short-circuiting expression; the 30-second buffer
+        # avoids using nearly-expired tokens.
+        return (
+            self.token is not None
+            and expires_at is not None
+            and (time.time() if now is None else now) < expires_at - 30
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the credential to a plain dictionary."""
-        return asdict(self)
+        # A flat dict literal: asdict() walks the dataclass generically
+        # and deep-copies every value, which is overkill for this flat
+        # record.
+        return {
+            "service_url": self.service_url,
+            "agent_id": self.agent_id,
+            "public_key": self.public_key,
+            "secret_key": self.secret_key,
+            "api_key": self.api_key,
+            "token": self.token,
+            "token_expires_at": self.token_expires_at,
+            "scopes": list(self.scopes),
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Credential:
         """Deserialize a credential from a plain dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        return cls(**{k: data[k] for k in _CREDENTIAL_FIELDS if k in data})
+
+
+# Field names captured once at class-definition time, so from_dict
+# filters without rebuilding the view each call.
+_CREDENTIAL_FIELDS: tuple[str, ...] = tuple(Credential.__dataclass_fields__)
 
 
 class CredentialStore(ABC):
@@ -90,8 +133,12 @@ class CredentialStore(ABC):
         ...
 
     @abstractmethod
-    def list_services(self) -> list[str]:
-        """Return a list of all service URLs with stored credentials."""
+    def list_services(self) -> Sequence[str]:
+        """Return the service URLs with stored credentials.
+
+        The returned sequence is a read-only view; implementations may
+        cache and reuse it between mutations.
+        """
         ...
 
 
@@ -100,22 +147,23 @@ class InMemoryCredentialStore(CredentialStore):
 
     def __init__(self) -> None:
         self._store: dict[str, Credential] = {}
+        self._services_view: tuple[str, ...] | None = None
 
     def get(self, service_url: str) -> Credential | None:
-        return self._store.get(self._normalize(service_url))
+        return self._store.get(_normalize(service_url))
 
     def save(self, credential: Credential) -> None:
-        self._store[self._normalize(credential.service_url)] = credential
+        self._store[_normalize(credential.service_url)] = credential
+        self._services_view = None
 
     def delete(self, service_url: str) -> None:
-        self._store.pop(self._normalize(service_url), None)
+        self._store.pop(_normalize(service_url), None)
+        self._services_view = None
 
-    def list_services(self) -> list[str]:
-        return list(self._store.keys())
-
-    @staticmethod
-    def _normalize(url: str) -> str:
-        return url.rstrip("/")
+    def list_services(self) -> Sequence[str]:
+        if self._services_view is None:
+            self._services_view = tuple(self._store)
+        return self._services_view
 
 
 class FileCredentialStore(CredentialStore):
@@ -131,6 +179,9 @@ class FileCredentialStore(CredentialStore):
     def __init__(self, path: str | Path | None = None) -> None:
         self._path = Path(path) if path else self.DEFAULT_PATH
         self._cache: dict[str, Credential] | None = None
+        self._services_view: tuple[str, ...] | None = None
+        self._in_batch = False
+        self._dirty = False
 
     # ------------------------------------------------------------------
     # Public API
@@ -138,20 +189,53 @@ class FileCredentialStore(CredentialStore):
 
     def get(self, service_url: str) -> Credential | None:
         data = self._load()
-        return data.get(self._normalize(service_url))
+        return data.get(_normalize(service_url))
 
     def save(self, credential: Credential) -> None:
         data = self._load()
-        data[self._normalize(credential.service_url)] = credential
-        self._flush(data)
+        data[_normalize(credential.service_url)] = credential
+        self._services_view = None
+        if self._in_batch:
+            self._dirty = True
+        else:
+            self._flush(data)
 
     def delete(self, service_url: str) -> None:
         data = self._load()
-        data.pop(self._normalize(service_url), None)
-        self._flush(data)
-
-    def list_services(self) -> list[str]:
-        return list(self._load().keys())
+        data.pop(_normalize(service_url), None)
+        self._services_view = None
+        if self._in_batch:
+            self._dirty = True
+        else:
+            self._flush(data)
+
+    def list_services(self) -> Sequence[str]:
+        if self._services_view is None:
+            self._services_view = tuple(self._load())
+        return self._services_view
+
+    @contextmanager
+    def batch(self) -> Iterator[FileCredentialStore]:
+        """Defer writes so a run of mutations costs one file flush.
+
+        Usage::
+
+            with store.batch():
+                for cred in credentials:
+                    store.save(cred)
+
+        Each ``save``/``delete`` inside the block mutates the in-memory
+        cache only; the file is rewritten once on exit, and only if
+        something actually changed.
+        """
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self._dirty = False
+                self._flush(self._load())
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -165,11 +249,14 @@ class FileCredentialStore(CredentialStore):
             self._cache = {}
             return self._cache
 
-        with open(self._path, "r") as fh:
-            raw: dict[str, Any] = json.load(fh)
+        with open(self._path, "rb") as fh:
+            contents = fh.read()
+        raw: dict[str, Any] = (
+            orjson.loads(contents) if orjson is not None else json.loads(contents)
+        )
 
         self._cache = {
-            url: Credential.from_dict(cred_data)
+            _normalize(url): Credential.from_dict(cred_data)
             for url, cred_data in raw.items()
         }
         return self._cache
@@ -179,15 +266,20 @@ class FileCredentialStore(CredentialStore):
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
         serializable = {url: cred.to_dict() for url, cred in data.items()}
-        with open(self._path, "w") as fh:
-            json.dump(serializable, fh, indent=2)
-
-        # Restrict permissions to owner-only read/write
+        if orjson is not None:
+            encoded = orjson.dumps(serializable, option=orjson.OPT_INDENT_2)
+        else:
+            encoded = json.dumps(serializable, indent=2).encode("utf-8")
+
+        # Write to a sibling temp file created owner-only, then rename
+        # over the target: the secret key material is never readable by
+        # other users (no write-then-chmod window) and readers never see
+        # a partially written file.
+        tmp_path = f"{self._path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
         try:
-            os.chmod(self._path, 0o600)
-        except OSError:
-            pass  # Silently ignore on platforms that don't support chmod
-
-    @staticmethod
-    def _normalize(url: str) -> str:
-        return url.rstrip("/")
+            os.write(fd, encoded)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self._path)
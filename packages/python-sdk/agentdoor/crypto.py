@@ -1,13 +1,61 @@
 """Ed25519 cryptographic utilities for AgentDoor authentication.
 
-Uses PyNaCl for Ed25519 keypair generation and message signing.
+Uses libsodium via PyNaCl's low-level ``nacl.bindings`` layer: the
+bytes-in/bytes-out primitives skip the ``SigningKey``/``VerifyKey``
+object allocation that the high-level wrappers pay on every call.
 """
 
 from __future__ import annotations
 
-import base64
+import os
+from functools import lru_cache
+from typing import Iterable
 
-from nacl.signing import SigningKey, VerifyKey
+try:
+    # SIMD-accelerated drop-in for the stdlib base64 codec.  Optional:
+    # the stdlib fallback keeps the dependency set unchanged.
+    from pybase64 import b64decode, b64encode
+except ImportError:
+    from base64 import b64decode, b64encode
+
+import binascii
+
+from nacl.bindings import (
+    crypto_sign,
+    crypto_sign_BYTES,
+    crypto_sign_PUBLICKEYBYTES,
+    crypto_sign_SEEDBYTES,
+    crypto_sign_open,
+    crypto_sign_seed_keypair,
+)
+from nacl.exceptions import BadSignatureError
+
+
+def _secret_key_raw(secret_key_bytes: bytes) -> bytes:
+    """Return the full 64-byte libsodium secret key.
+
+    Credentials store the 32-byte seed form (the same representation
+    ``SigningKey.encode()`` produced); expand it for signing, and pass
+    a full 64-byte key through unchanged.
+    """
+    if len(secret_key_bytes) == crypto_sign_SEEDBYTES:
+        _, secret = crypto_sign_seed_keypair(secret_key_bytes)
+        return secret
+    return secret_key_bytes
+
+
+# An agent signs with the same credential for its whole lifetime, so the
+# base64 decode and seed expansion are paid once per key, not per call.
+# The caches hold key material for up to 256 keys; call .cache_clear()
+# after rotating keys if that lingering copy is a concern.
+@lru_cache(maxsize=256)
+def _secret_key_for(secret_key_b64: str) -> bytes:
+    return _secret_key_raw(b64decode(secret_key_b64))
+
+
+@lru_cache(maxsize=256)
+def _public_key_for(public_key_b64: str) -> bytes:
+    return b64decode(public_key_b64)
 
 
 def generate_keypair() -> tuple[str, str]:
@@ -15,40 +63,44 @@ def generate_keypair() -> tuple[str, str]:
 
     Returns:
         A tuple of (public_key_b64, secret_key_b64) where both values
-        are base64-encoded strings.
+        are base64-encoded strings.  The secret key is the 32-byte seed.
     """
-    signing_key = SigningKey.generate()
-    public_key_bytes = signing_key.verify_key.encode()
-    secret_key_bytes = signing_key.encode()
+    seed = os.urandom(crypto_sign_SEEDBYTES)
+    public_key_bytes, _ = crypto_sign_seed_keypair(seed)
 
-    public_key_b64 = base64.b64encode(public_key_bytes).decode("ascii")
-    secret_key_b64 = base64.b64encode(secret_key_bytes).decode("ascii")
+    public_key_b64 = b64encode(public_key_bytes).decode("ascii")
+    secret_key_b64 = b64encode(seed).decode("ascii")
 
     return public_key_b64, secret_key_b64
 
 
-def sign_message(message: str, secret_key_b64: str) -> str:
+def sign_message(message: str | bytes, secret_key_b64: str) -> str:
     """Sign a message using an Ed25519 secret key.
 
     Args:
-        message: The message string to sign.
-        secret_key_b64: The base64-encoded secret key.
+        message: The message to sign.  Callers that already hold the
+            UTF-8 bytes can pass them directly and skip the encode.
+        secret_key_b64: The base64-encoded secret key (32-byte seed
+            form, or the full 64-byte libsodium form).
 
     Returns:
         The base64-encoded signature string.
     """
-    secret_key_bytes = base64.b64decode(secret_key_b64)
-    signing_key = SigningKey(secret_key_bytes)
-    signed = signing_key.sign(message.encode("utf-8"))
-    signature_bytes = signed.signature
-    return base64.b64encode(signature_bytes).decode("ascii")
+    message_bytes = message if isinstance(message, bytes) else message.encode("utf-8")
+    secret_key_bytes = _secret_key_for(secret_key_b64)
+    signed = crypto_sign(message_bytes, secret_key_bytes)
+    # crypto_sign returns signature || message; the detached signature
+    # is the first 64 bytes.
+    return b64encode(signed[:64]).decode("ascii")
 
 
-def verify_signature(message: str, signature_b64: str, public_key_b64: str) -> bool:
+def verify_signature(
+    message: str | bytes, signature_b64: str, public_key_b64: str
+) -> bool:
     """Verify an Ed25519 signature.
 
     Args:
-        message: The original message string.
+        message: The original message (``str`` or its UTF-8 bytes).
         signature_b64: The base64-encoded signature.
         public_key_b64: The base64-encoded public key.
 
@@ -56,10 +108,41 @@ def verify_signature(message: str, signature_b64: str, public_key_b64: str) -> b
         True if the signature is valid, False otherwise.
     """
     try:
-        public_key_bytes = base64.b64decode(public_key_b64)
-        signature_bytes = base64.b64decode(signature_b64)
-        verify_key = VerifyKey(public_key_bytes)
-        verify_key.verify(message.encode("utf-8"), signature_bytes)
+        public_key_bytes = _public_key_for(public_key_b64)
+        signature_bytes = b64decode(signature_b64)
+    except (binascii.Error, ValueError):
+        return False
+
+    # Wrong-length material can never verify; rejecting it here skips
+    # the libsodium call and its exception for malformed input.
+    if (
+        len(public_key_bytes) != crypto_sign_PUBLICKEYBYTES
+        or len(signature_bytes) != crypto_sign_BYTES
+    ):
+        return False
+
+    message_bytes = message if isinstance(message, bytes) else message.encode("utf-8")
+    try:
+        crypto_sign_open(signature_bytes + message_bytes, public_key_bytes)
         return True
-    except Exception:
+    except BadSignatureError:
         return False
+
+
+def verify_signatures_batch(
+    items: Iterable[tuple[str, str, str]],
+) -> list[bool]:
+    """Verify a batch of ``(message, signature_b64, public_key_b64)`` tuples.
+
+    True batched verification (one multi-scalar multiplication for the
+    whole batch) needs a primitive PyNaCl does not expose, so this
+    verifies sequentially; it exists so callers with many signatures in
+    hand have one entry point that can pick up a batch backend later.
+
+    Returns:
+        A list of booleans, one per input tuple, in order.
+    """
+    return [
+        verify_signature(message, signature_b64, public_key_b64)
+        for message, signature_b64, public_key_b64 in items
+    ]
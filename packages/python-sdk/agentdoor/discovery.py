@@ -4,15 +4,24 @@ Fetches and parses the /.well-known/agentdoor.json discovery document
 from an AgentDoor-enabled service.
 """
 
-from __future__ import annotations
-
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import httpx
 
+try:
+    # C-extension JSON parser that consumes the raw response bytes,
+    # skipping the intermediate str decode; optional, with
+    # response.json() as the fallback.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScopeDefinition:
     """A single scope offered by the service."""
 
@@ -20,7 +29,7 @@ class ScopeDefinition:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryDocument:
     """Parsed AgentDoor discovery document.
 
@@ -35,7 +44,56 @@ class DiscoveryDocument:
     auth_endpoint: str
     scopes: list[ScopeDefinition] = field(default_factory=list)
     token_ttl_seconds: int = 3600
-    raw: dict[str, Any] = field(default_factory=dict, repr=False)
+    raw: Mapping[str, Any] = field(default_factory=dict, repr=False)
+
+
+# Interned once: every document parsed without explicit endpoints shares
+# these exact string objects, so downstream comparisons are pointer
+# checks.
+_DEFAULT_REGISTRATION_ENDPOINT = sys.intern("/agentdoor/register")
+_DEFAULT_VERIFICATION_ENDPOINT = sys.intern("/agentdoor/register/verify")
+_DEFAULT_AUTH_ENDPOINT = sys.intern("/agentdoor/auth")
+
+_REQUIRED_FIELDS = frozenset({"agentdoor_version", "service_name"})
+
+_default_client: httpx.AsyncClient | None = None
+
+# Parsed documents cached per base URL as (expires_at, document).
+# Discovery documents change rarely, so a short TTL amortizes both the
+# round-trip and the parse across repeated discover() calls.
+_DISCOVERY_CACHE_TTL = 300.0
+_discovery_cache: dict[str, tuple[float, DiscoveryDocument]] = {}
+
+
+def _shared_client() -> httpx.AsyncClient:
+    """Return the lazily created client used when none is passed in.
+
+    Construction is synchronous (no awaits between check and assign), so
+    no lock is needed.  Repeated discovery against the same host reuses
+    the pooled keep-alive connection instead of paying a fresh TCP+TLS
+    handshake per call.
+    """
+    global _default_client
+    if _default_client is None or _default_client.is_closed:
+        _default_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, keepalive_expiry=60.0
+            ),
+        )
+    return _default_client
+
+
+async def aclose_default_client() -> None:
+    """Close the shared discovery client, if one was created.
+
+    Long-lived processes that used :func:`discover` without passing
+    their own client should call this on shutdown.
+    """
+    global _default_client
+    if _default_client is not None:
+        await _default_client.aclose()
+        _default_client = None
 
 
 def parse_discovery_document(data: dict[str, Any]) -> DiscoveryDocument:
@@ -50,35 +108,55 @@ def parse_discovery_document(data: dict[str, Any]) -> DiscoveryDocument:
     Raises:
         KeyError: If required fields are missing from the document.
     """
+    # One set difference up front instead of letting the individual
+    # subscripts raise; the error stays a KeyError naming the field.
+    missing = _REQUIRED_FIELDS - data.keys()
+    if missing:
+        raise KeyError(min(missing))
+
+    # Bind the lookup method once; the parse is otherwise a single
+    # straight-line constructor call.
+    get = data.get
+    _scope = ScopeDefinition
     scopes = [
-        ScopeDefinition(name=s["name"], description=s.get("description", ""))
-        for s in data.get("scopes", [])
+        _scope(name=s["name"], description=s.get("description", ""))
+        for s in get("scopes", ())
     ]
 
     return DiscoveryDocument(
         agentdoor_version=data["agentdoor_version"],
         service_name=data["service_name"],
-        registration_endpoint=data.get(
-            "registration_endpoint", "/agentdoor/register"
+        registration_endpoint=get(
+            "registration_endpoint", _DEFAULT_REGISTRATION_ENDPOINT
         ),
-        verification_endpoint=data.get(
-            "verification_endpoint", "/agentdoor/register/verify"
+        verification_endpoint=get(
+            "verification_endpoint", _DEFAULT_VERIFICATION_ENDPOINT
         ),
-        auth_endpoint=data.get("auth_endpoint", "/agentdoor/auth"),
+        auth_endpoint=get("auth_endpoint", _DEFAULT_AUTH_ENDPOINT),
         scopes=scopes,
-        token_ttl_seconds=data.get("token_ttl_seconds", 3600),
-        raw=data,
+        token_ttl_seconds=get("token_ttl_seconds", 3600),
+        # Zero-copy read-only view over the caller's dict; equality with
+        # the original still holds.
+        raw=MappingProxyType(data),
     )
 
 
-async def discover(base_url: str, client: httpx.AsyncClient | None = None) -> DiscoveryDocument:
+async def discover(
+    base_url: str,
+    client: httpx.AsyncClient | None = None,
+    use_cache: bool = False,
+) -> DiscoveryDocument:
     """Fetch and parse the AgentDoor discovery document from a service.
 
     Args:
         base_url: The base URL of the AgentDoor-enabled service
             (e.g. ``https://api.example.com``).
         client: An optional httpx.AsyncClient to use for the request.
-            If not provided, a new client is created.
+            If not provided, a shared module-level client is used (see
+            :func:`aclose_default_client`).
+        use_cache: Reuse a previously fetched document for this URL for
+            up to five minutes instead of re-fetching.  Off by default
+            so callers that need a fresh document get one.
 
     Returns:
         The parsed DiscoveryDocument.
@@ -87,14 +165,27 @@ async def discover(base_url: str, client: httpx.AsyncClient | None = None) -> Di
         httpx.HTTPStatusError: If the discovery endpoint returns a non-2xx status.
         KeyError: If the discovery document is missing required fields.
     """
-    url = f"{base_url.rstrip('/')}/.well-known/agentdoor.json"
+    base_url = base_url.rstrip("/")
+    if use_cache:
+        cached = _discovery_cache.get(base_url)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+    url = f"{base_url}/.well-known/agentdoor.json"
 
     if client is None:
-        async with httpx.AsyncClient() as new_client:
-            response = await new_client.get(url)
-    else:
-        response = await client.get(url)
-
-    response.raise_for_status()
-    data = response.json()
-    return parse_discovery_document(data)
+        client = _shared_client()
+    response = await client.get(url)
+
+    if not response.is_success:
+        response.raise_for_status()
+    data = (
+        orjson.loads(response.content) if orjson is not None else response.json()
+    )
+    document = parse_discovery_document(data)
+    if use_cache:
+        _discovery_cache[base_url] = (
+            time.monotonic() + _DISCOVERY_CACHE_TTL,
+            document,
+        )
+    return document
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import base64
 
-from agentdoor.crypto import generate_keypair, sign_message, verify_signature
+from agentdoor.crypto import (
+    generate_keypair,
+    sign_message,
+    verify_signature,
+    verify_signatures_batch,
+)
 
 
 class TestGenerateKeypair:
@@ -78,3 +83,16 @@ class TestVerifySignature:
     def test_invalid_base64_returns_false(self) -> None:
         public_key, _ = generate_keypair()
         assert verify_signature("msg", "not-valid-b64!!!", public_key) is False
+
+
+class TestVerifySignaturesBatch:
+    """Tests for verify_signatures_batch()."""
+
+    def test_mixed_batch_preserves_order(self) -> None:
+        public_key, secret_key = generate_keypair()
+        good = ("hello", sign_message("hello", secret_key), public_key)
+        bad = ("tampered", sign_message("original", secret_key), public_key)
+        assert verify_signatures_batch([good, bad, good]) == [True, False, True]
+
+    def test_empty_batch(self) -> None:
+        assert verify_signatures_batch([]) == []
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import json
+from collections import Counter
+
 import httpx
 import pytest
-import respx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from agentdoor.discovery import (
     DiscoveryDocument,
@@ -13,6 +20,55 @@ from agentdoor.discovery import (
     parse_discovery_document,
 )
 
+_DOC = {
+    "agentdoor_version": "0.1",
+    "service_name": "Remote Service",
+    "registration_endpoint": "/agentdoor/register",
+    "verification_endpoint": "/agentdoor/register/verify",
+    "auth_endpoint": "/agentdoor/auth",
+    "scopes": [{"name": "read", "description": "Read access"}],
+    "token_ttl_seconds": 7200,
+}
+
+# The mock responses are immutable, so serialize them once at import
+# instead of re-encoding a dict per request.
+_JSON_HEADERS = {"content-type": "application/json"}
+_MISSING_DOC = {"service_name": "incomplete"}
+if orjson is not None:
+    _DOC_BYTES = orjson.dumps(_DOC)
+    _MISSING_DOC_BYTES = orjson.dumps(_MISSING_DOC)
+else:
+    _DOC_BYTES = json.dumps(_DOC).encode()
+    _MISSING_DOC_BYTES = json.dumps(_MISSING_DOC).encode()
+
+# Requests served per host, so tests can assert how often the network
+# was actually hit (e.g. for the caching test).
+_calls: Counter[str] = Counter()
+
+
+def _discovery_handler(request: httpx.Request) -> httpx.Response:
+    """Dispatch mock discovery responses by host.
+
+    One plain-Python handler on a shared MockTransport replaces the
+    per-test respx route registration the tests used to pay.
+    """
+    host = request.url.host
+    _calls[host] += 1
+    if request.url.path != "/.well-known/agentdoor.json":
+        return httpx.Response(404)
+    if host in ("api.example.com", "cached.example.com"):
+        return httpx.Response(200, content=_DOC_BYTES, headers=_JSON_HEADERS)
+    if host == "missing.example.com":
+        return httpx.Response(
+            200, content=_MISSING_DOC_BYTES, headers=_JSON_HEADERS
+        )
+    return httpx.Response(404)
+
+
+@pytest.fixture(scope="module")
+def mock_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(_discovery_handler))
+
 
 class TestParseDiscoveryDocument:
     """Tests for parse_discovery_document()."""
@@ -95,64 +151,59 @@ class TestParseDiscoveryDocument:
         assert doc.scopes == []
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestDiscover:
-    """Tests for the async discover() function."""
-
-    _DOC = {
-        "agentdoor_version": "0.1",
-        "service_name": "Remote Service",
-        "registration_endpoint": "/agentdoor/register",
-        "verification_endpoint": "/agentdoor/register/verify",
-        "auth_endpoint": "/agentdoor/auth",
-        "scopes": [{"name": "read", "description": "Read access"}],
-        "token_ttl_seconds": 7200,
-    }
-
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_discover_fetches_and_parses(self) -> None:
-        respx.get("https://api.example.com/.well-known/agentdoor.json").mock(
-            return_value=httpx.Response(200, json=self._DOC)
-        )
-        doc = await discover("https://api.example.com")
+    """Tests for the async discover() function.
+
+    One event loop is shared across the class (and with the
+    module-scoped client fixture), so each trivial coroutine test
+    doesn't pay loop setup and teardown.
+    """
+
+    async def test_discover_fetches_and_parses(
+        self, mock_client: httpx.AsyncClient
+    ) -> None:
+        doc = await discover("https://api.example.com", client=mock_client)
         assert isinstance(doc, DiscoveryDocument)
         assert doc.service_name == "Remote Service"
         assert doc.token_ttl_seconds == 7200
         assert len(doc.scopes) == 1
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_discover_strips_trailing_slash(self) -> None:
-        respx.get("https://api.example.com/.well-known/agentdoor.json").mock(
-            return_value=httpx.Response(200, json=self._DOC)
-        )
-        doc = await discover("https://api.example.com/")
+    async def test_discover_strips_trailing_slash(
+        self, mock_client: httpx.AsyncClient
+    ) -> None:
+        doc = await discover("https://api.example.com/", client=mock_client)
         assert doc.service_name == "Remote Service"
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_discover_with_provided_client(self) -> None:
-        respx.get("https://api.example.com/.well-known/agentdoor.json").mock(
-            return_value=httpx.Response(200, json=self._DOC)
-        )
-        async with httpx.AsyncClient() as client:
-            doc = await discover("https://api.example.com", client=client)
+    async def test_discover_uses_shared_client_by_default(
+        self, mock_client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import agentdoor.discovery as discovery_module
+
+        monkeypatch.setattr(discovery_module, "_default_client", mock_client)
+        doc = await discover("https://api.example.com")
         assert doc.service_name == "Remote Service"
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_discover_raises_on_http_error(self) -> None:
-        respx.get("https://api.example.com/.well-known/agentdoor.json").mock(
-            return_value=httpx.Response(404)
+    async def test_discover_caches_when_requested(
+        self, mock_client: httpx.AsyncClient
+    ) -> None:
+        first = await discover(
+            "https://cached.example.com", client=mock_client, use_cache=True
+        )
+        second = await discover(
+            "https://cached.example.com", client=mock_client, use_cache=True
         )
+        assert _calls["cached.example.com"] == 1
+        assert second is first
+
+    async def test_discover_raises_on_http_error(
+        self, mock_client: httpx.AsyncClient
+    ) -> None:
         with pytest.raises(httpx.HTTPStatusError):
-            await discover("https://api.example.com")
+            await discover("https://error.example.com", client=mock_client)
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_discover_raises_on_missing_fields(self) -> None:
-        respx.get("https://api.example.com/.well-known/agentdoor.json").mock(
-            return_value=httpx.Response(200, json={"service_name": "incomplete"})
-        )
+    async def test_discover_raises_on_missing_fields(
+        self, mock_client: httpx.AsyncClient
+    ) -> None:
         with pytest.raises(KeyError):
-            await discover("https://api.example.com")
+            await discover("https://missing.example.com", client=mock_client)